@@ -3,7 +3,7 @@ from dataclasses import dataclass, field
 from reportlab.lib.units import inch
 
 
-@dataclass
+@dataclass(slots=True)
 class Configuration:
     """Constant values used in multiple classes."""
     pagesize: tuple = field(default=(4 * inch, 6 * inch))
@@ -1,14 +1,26 @@
 import os
 import sys
+from dataclasses import fields
 
 import yaml
-from models import Hymn
-from pdf_elements import HymnPDFGenerator
+from hymn_pdf_generator.models import Hymn
+from hymn_pdf_generator.pdf_elements import HymnPDFGenerator
+
+# Prefer the libyaml-backed loader: parsing is the dominant startup cost
+# for large hymn books and the C loader is roughly an order of magnitude
+# faster than the pure-Python SafeLoader.
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Input fields accepted for a hymn, derived from the dataclass so the
+# loader and the model cannot drift apart
+_HYMN_KEYS = tuple(f.name for f in fields(Hymn) if f.init)
 
 
 def main(yaml_path: str):
-    with open(yaml_path, 'r') as file:
-        data = yaml.safe_load(file)
+    # Open in binary mode so libyaml consumes the raw bytes directly,
+    # skipping the Python-level decode step.
+    with open(yaml_path, 'rb') as file:
+        data = yaml.load(file, Loader=_YamlLoader)
 
     hymn_book = data['hymn_book']
 
@@ -17,16 +29,7 @@ def main(yaml_path: str):
     owner = hymn_book['owner']
 
     hymns = [
-        Hymn(
-            number=hymn.get('number'),
-            title=hymn.get('title'),
-            style=hymn.get('style'),
-            offered_to=hymn.get('offered_to'),
-            extra_instructions=hymn.get('extra_instructions'),
-            text=hymn.get('text'),
-            repetitions=hymn.get('repetitions'),
-            received_at=hymn.get('received_at')
-        )
+        Hymn(**{key: hymn.get(key) for key in _HYMN_KEYS})
         for hymn in hymn_book['hymns']
     ]
 
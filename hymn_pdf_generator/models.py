@@ -1,17 +1,40 @@
-from dataclasses import dataclass
-from typing import Optional
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
-from config import Configuration
+from hymn_pdf_generator.config import Configuration
 from reportlab.pdfbase.pdfmetrics import stringWidth
 
+@lru_cache(maxsize=None)
+def _char_width(char: str, font_name: str) -> float:
+    """Advance width of a single character at 1000 pt."""
+    return stringWidth(char, font_name, 1000)
 
-@dataclass
-class MetaHymn:
+
+# Hymn lyrics repeat many identical lines (choruses), so memoizing per
+# line avoids summing the same character widths again for every repeat.
+@lru_cache(maxsize=8192)
+def _line_width(line: str, font_name: str, font_size: float) -> float:
+    """
+    Width of a line of text, summed from cached per-character widths.
+
+    Glyph advances scale linearly with the font size, so each distinct
+    character is measured only once (at 1000 pt) per font.
+    """
+    return sum(_char_width(char, font_name)
+               for char in line) * font_size / 1000.0
+
+
+# Shared configuration: hymns only read these values, so one instance
+# serves every hymn instead of each carrying its own copies.
+CONFIG = Configuration()
+
+
+@dataclass(slots=True)
+class Hymn:
     """
-    Meta class representing a hymn. It's necessary so the Hymn is
-    composed by Configuration and MetaHymn in this order since
-    Configuration has default properties and can't be after non-default
-    properties.
+    Data class representing a hymn.
     """
     number: int
     title: str
@@ -22,12 +45,31 @@ class MetaHymn:
     repetitions: Optional[str]
     received_at: Optional[str]
 
+    # Lazily computed derived values. Slots leave no __dict__ for
+    # functools.cached_property, so these are cached by hand.
+    _lines_cache: Optional[Tuple[str, ...]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _paragraphs_cache: Optional[Tuple[str, ...]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _font_size_cache: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False)
+    _line_counts_cache: Optional[Tuple[List[int], List[int]]] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    @property
+    def lines(self) -> Tuple[str, ...]:
+        """The hymn text split into lines, computed once."""
+        if self._lines_cache is None:
+            self._lines_cache = tuple(self.text.split("\n"))
+        return self._lines_cache
+
+    @property
+    def paragraphs(self) -> Tuple[str, ...]:
+        """The hymn text split into stanzas, computed once."""
+        if self._paragraphs_cache is None:
+            self._paragraphs_cache = tuple(self.text.strip().split("\n\n"))
+        return self._paragraphs_cache
 
-@dataclass
-class Hymn(Configuration, MetaHymn):
-    """
-    Data class representing a hymn.
-    """
     @property
     def adjusted_font_size(self) -> int:
         """
@@ -35,16 +77,55 @@ class Hymn(Configuration, MetaHymn):
 
         :return: The adjusted font size.
         """
-        font_size = self.default_body_font_size
-        max_width = self.pagesize[0] - 2 * self.margin
+        if self._font_size_cache is not None:
+            return self._font_size_cache
+
+        default_size = CONFIG.default_body_font_size
+        font_name = CONFIG.font_name
+        max_width = CONFIG.pagesize[0] - 2 * CONFIG.margin
         max_width -= 14  # Adjust for the leading
 
-        for line in self.text.split("\n"):
-            while stringWidth(line, self.font_name, font_size) > max_width and font_size > 6:
-                font_size -= 1
+        widest = max(
+            (_line_width(line, font_name, default_size)
+             for line in self.lines),
+            default=0
+        )
+        if widest <= max_width:
+            font_size = default_size
+        else:
+            # Glyph widths scale linearly with the font size, so the
+            # largest size that fits can be solved directly instead of
+            # shrinking one point at a time and re-measuring every line.
+            font_size = max(6, int(default_size * max_width / widest))
 
+        self._font_size_cache = font_size
         return font_size
 
+    @property
+    def _line_counts(self) -> Tuple[List[int], List[int]]:
+        """
+        Cumulative blank and non-blank line counts, built once per hymn.
+
+        :return: Two lists where position i holds the number of blank
+            (respectively non-blank) lines among lines[0..i].
+        """
+        if self._line_counts_cache is not None:
+            return self._line_counts_cache
+
+        blanks_prefix = []
+        nonblanks_prefix = []
+        blanks = nonblanks = 0
+        for line in self.lines:
+            if line.strip():
+                nonblanks += 1
+            else:
+                blanks += 1
+            blanks_prefix.append(blanks)
+            nonblanks_prefix.append(nonblanks)
+
+        self._line_counts_cache = (blanks_prefix, nonblanks_prefix)
+        return self._line_counts_cache
+
     def count_blank_lines(self, start_line, end_line) -> int:
         """
         Count the number of blank lines between the start and end line,
@@ -54,21 +135,19 @@ class Hymn(Configuration, MetaHymn):
         :param end_line: The end line starting by 0.
         :return: The number of blank lines.
         """
-        lines = self.text.split("\n")
-        non_blank_line_count = 0
-        actual_end_line = start_line
+        blanks_prefix, nonblanks_prefix = self._line_counts
+        if start_line >= len(blanks_prefix):
+            return 0
 
-        # Find the actual end line index considering only non-blank lines
-        for i, line in enumerate(lines[start_line:], start=start_line):
-            if line.strip():
-                non_blank_line_count += 1
-            if non_blank_line_count > end_line:
-                actual_end_line = i
-                break
-            actual_end_line = i
-
-        # Count blank lines in the range
-        return sum(
-            1 for line in lines[start_line:actual_end_line + 1]
-            if not line.strip()
-        )
\ No newline at end of file
+        blanks_before = blanks_prefix[start_line - 1] if start_line else 0
+        nonblanks_before = nonblanks_prefix[start_line - 1] if start_line else 0
+
+        # Locate the raw index of the (end_line + 1)-th non-blank line
+        # after start_line; past the end, fall back to the last line.
+        raw_end = bisect_left(nonblanks_prefix,
+                              nonblanks_before + end_line + 1,
+                              lo=start_line)
+        if raw_end >= len(blanks_prefix):
+            raw_end = len(blanks_prefix) - 1
+
+        return blanks_prefix[raw_end] - blanks_before
\ No newline at end of file
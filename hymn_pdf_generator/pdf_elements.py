@@ -1,18 +1,23 @@
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from io import BytesIO
 from typing import List
 
-from config import Configuration
-from models import Hymn
+from hymn_pdf_generator.config import Configuration
+from PIL import Image
+from hymn_pdf_generator.models import Hymn
 from reportlab.lib.enums import TA_CENTER
 from reportlab.lib.styles import ParagraphStyle, getSampleStyleSheet
 from reportlab.lib.units import inch
 from reportlab.lib.utils import ImageReader
+from reportlab import rl_config
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 from reportlab.pdfgen import canvas
 from reportlab.platypus import (
     Flowable,
     Frame,
-    HRFlowable,
     KeepTogether,
     PageBreak,
     PageTemplate,
@@ -23,20 +28,124 @@ from reportlab.platypus import (
 
 from hymn_pdf_generator.repetition_bar_allocator import RepetitionBarXAxisAllocator
 
-# Register the DejaVu Sans font
-pdfmetrics.registerFont(TTFont('DejaVuSans', 'DejaVuSans.ttf'))
+# Register the DejaVu Sans font (skip when already registered so module
+# reloads and subprocesses don't re-parse the TTF tables)
+if 'DejaVuSans' not in pdfmetrics.getRegisteredFontNames():
+    pdfmetrics.registerFont(TTFont('DejaVuSans', 'DejaVuSans.ttf'))
 
-class VerticalLine(Flowable):
-    def __init__(self, x, y_start, y_end, thickness=0.7):
+# Below this many hymns the process-pool startup outweighs the layout
+# work saved, so small books are built sequentially.
+MIN_HYMNS_FOR_PARALLEL_BUILD = 24
+
+# PageBreak is stateless, so one shared instance serves every hymn
+_PAGE_BREAK = PageBreak()
+
+# Only three styles from ReportLab's sample stylesheet are ever used as
+# parents; keep just those instead of the whole sheet.
+_sample_sheet = getSampleStyleSheet()
+_BASE_STYLES = {name: _sample_sheet[name]
+                for name in ('Title', 'Normal', 'BodyText')}
+del _sample_sheet
+
+
+@lru_cache(maxsize=1024)
+def _to_break_tags(text: str) -> str:
+    """Replace newlines with <br/> tags, memoized for repeated texts."""
+    return text.replace("\n", "<br/>")
+
+
+# Scaled geometry constants shared by the hymn builders; hymns resolve
+# to very few distinct font sizes, so these are computed once per size
+_BarGeometry = namedtuple(
+    '_BarGeometry',
+    ['resize_factor', 'y_padding', 'x_bars_distance', 'one_line',
+     'one_blank_line', 'between_lines', 'line_step'])
+
+
+@lru_cache(maxsize=32)
+def _bar_geometry(font_size: int, default_font_size: int) -> _BarGeometry:
+    """
+    Geometry constants for a hymn, scaled in case the font was resized
+    to fit in page.
+    """
+    resize_factor = font_size / default_font_size
+    # Bar hight for one line
+    one_line = 7 * resize_factor
+    # Distance between two lines
+    between_lines = 9 * resize_factor
+    return _BarGeometry(
+        resize_factor=resize_factor,
+        # Y padding
+        y_padding=-8 + -4 * resize_factor,
+        # X distance between bars
+        x_bars_distance=6 * resize_factor,
+        one_line=one_line,
+        # Bar hight for one blank line
+        one_blank_line=8.5 * resize_factor,
+        between_lines=between_lines,
+        # Combined vertical step from one line to the next
+        line_step=one_line + between_lines,
+    )
+
+
+@lru_cache(maxsize=512)
+def _repetition_bar_entries(repetitions: str) -> tuple:
+    """
+    Bar entries with allocated levels for a repetitions spec, computed
+    once per distinct string since many hymns share the same pattern.
+    The entries are read-only for the callers.
+    """
+    allocator = RepetitionBarXAxisAllocator()
+    return tuple(allocator.get_entries_with_levels(repetitions))
+
+
+# KeepTogether resolves a couple of class attributes lazily in its
+# __init__; instances unpickled from worker processes skip __init__, so
+# trigger that resolution once up front.
+KeepTogether([])
+
+class VerticalLines(Flowable):
+    """
+    Draws all the repetition bars of a hymn in one flowable.
+
+    Batching the segments costs one draw() call and one line-width set
+    per hymn, instead of one flowable per bar.
+    """
+
+    def __init__(self, segments, thickness=0.7):
         Flowable.__init__(self)
-        self.x = x
-        self.y_start = y_start
-        self.y_end = y_end
+        self.segments = segments
         self.thickness = thickness
 
     def draw(self):
         self.canv.setLineWidth(self.thickness)
-        self.canv.line(self.x, self.y_start, self.x, self.y_end)
+        self.canv.lines([(x, y_start, x, y_end)
+                         for x, y_start, y_end in self.segments])
+
+
+class HorizontalRule(Flowable):
+    """
+    Full-width rule drawn under each title. Lighter than HRFlowable,
+    which carries colour/dash/rounded-cap handling the titles never use.
+    """
+
+    def __init__(self, thickness=1, space_after=2):
+        Flowable.__init__(self)
+        self.thickness = thickness
+        self.spaceAfter = space_after
+
+    def wrap(self, availWidth, availHeight):
+        self.width = availWidth
+        return availWidth, self.thickness
+
+    def draw(self):
+        self.canv.setLineWidth(self.thickness)
+        self.canv.line(0, self.thickness / 2.0, self.width,
+                       self.thickness / 2.0)
+
+
+# The rule keeps no per-hymn state, so one instance serves every title
+_TITLE_RULE = HorizontalRule()
 
 
 class PageNumCanvas(canvas.Canvas, Configuration):
@@ -45,6 +154,8 @@ class PageNumCanvas(canvas.Canvas, Configuration):
         Configuration.__init__(self)  # Initialize Configuration
 
     def showPage(self):
+        # Each finished page gets its number here exactly once; save()
+        # must not draw again or a spurious trailing page appears.
         self.draw_page_number()
         super().showPage()
 
@@ -56,16 +167,16 @@ class PageNumCanvas(canvas.Canvas, Configuration):
                                  self.margin,
                                  str(page_num))
 
-    def save(self):
-        self.draw_page_number()
-        super().save()
-
 
 class HymnPDFGenerator(Configuration):
     """
     A class to generate a PDF for a given hymn.
     """
 
+    # Custom styles derived from the base styles, shared by all
+    # generator instances
+    _custom_styles = None
+
     def __init__(self, hymns: List[Hymn], filename: str, intro_name: str, name: str, owner: str, cover_image_path: str):
         """
         Initialize the HymnPDFGenerator with hymns, output filename, and cover page details.
@@ -77,20 +188,56 @@ class HymnPDFGenerator(Configuration):
         :param owner: Owner name for the cover page.
         :param cover_image_path: Background image for the cover page.
         """
+        Configuration.__init__(self)
         self.hymns = hymns
         self.filename = filename
         self.intro_name = intro_name
         self.name = name
         self.owner = owner
         self.cover_image_path = cover_image_path
-        self.styles = getSampleStyleSheet()
+        # Numbered titles only depend on the hymn order, so format them
+        # in one pass here instead of on every build
+        self._titles = tuple(
+            f"{idx:02d}. {hymn.title} ({hymn.number:02d})"
+            for idx, hymn in enumerate(hymns, start=1)
+        )
+        self._bg_image, self._bg_position = self._prepare_background_image()
+        self.styles = _BASE_STYLES
         self._setup_styles()
+        # Adjusted styles are shared between hymns that resolve to the
+        # same font size, instead of re-created for every hymn.
+        self._body_style_cache = {}
+        self._details_style_cache = {}
+        # Built elements from the previous create_pdf call, reused when
+        # the hymn content is unchanged (e.g. preview + final runs)
+        self._last_signature = None
+        self._last_elements = None
 
     def _setup_styles(self):
         """
         Set up custom paragraph styles.
+
+        The styles depend only on the shared Configuration values, so
+        they are built on first instantiation and reused by every
+        generator afterwards.
         """
-        self.cover_intro_style = ParagraphStyle(
+        if HymnPDFGenerator._custom_styles is None:
+            HymnPDFGenerator._custom_styles = self._build_custom_styles()
+
+        for attribute, style in HymnPDFGenerator._custom_styles.items():
+            setattr(self, attribute, style)
+
+        # The after-hymn symbols never change, so parse them once and
+        # reuse the same Paragraphs for every hymn
+        self._davi_star_paragraph = Paragraph("&#x2721;",
+                                              self.davi_star_style)
+        self._symbols_paragraph = Paragraph("☀ ☾ ★", self.symbols_style)
+
+    def _build_custom_styles(self):
+        """
+        Build the custom paragraph styles keyed by attribute name.
+        """
+        cover_intro_style = ParagraphStyle(
             'CoverIntroStyle',
             parent=self.styles['Title'],
             fontName=self.font_name,
@@ -99,7 +246,7 @@ class HymnPDFGenerator(Configuration):
             spaceAfter=34
         )
 
-        self.cover_name_style = ParagraphStyle(
+        cover_name_style = ParagraphStyle(
             'CoverNameStyle',
             parent=self.styles['Title'],
             fontName=self.font_name,
@@ -108,7 +255,7 @@ class HymnPDFGenerator(Configuration):
             spaceAfter=34
         )
 
-        self.cover_owner_style = ParagraphStyle(
+        cover_owner_style = ParagraphStyle(
             'CoverOwnerStyle',
             parent=self.styles['Title'],
             fontName=self.font_name,
@@ -117,7 +264,7 @@ class HymnPDFGenerator(Configuration):
             spaceAfter=24
         )
 
-        self.title_style = ParagraphStyle(
+        title_style = ParagraphStyle(
             'TitleStyle',
             parent=self.styles['Title'],
             fontSize=self.title_font_size,
@@ -126,7 +273,16 @@ class HymnPDFGenerator(Configuration):
             spaceAfter=0
         )
 
-        self.details_on_top_style = ParagraphStyle(
+        # Variant used from the second hymn on: the paginator starts a
+        # new page before the title, replacing the per-hymn PageBreak
+        # flowables that would otherwise go through wrap/split
+        title_break_style = ParagraphStyle(
+            'TitleBreakStyle',
+            parent=title_style,
+            pageBreakBefore=1
+        )
+
+        details_on_top_style = ParagraphStyle(
             'RightAlignStyle',
             parent=self.styles['Normal'],
             fontName=self.font_name,
@@ -136,7 +292,7 @@ class HymnPDFGenerator(Configuration):
             spaceAfter=8
         )
 
-        self.body_style = ParagraphStyle(
+        body_style = ParagraphStyle(
             'BodyStyle',
             parent=self.styles['BodyText'],
             fontName=self.font_name,
@@ -145,7 +301,7 @@ class HymnPDFGenerator(Configuration):
             spaceAfter=0.12 * inch
         )
 
-        self.davi_star_style = ParagraphStyle(
+        davi_star_style = ParagraphStyle(
             'DaviStarStyle',
             parent=self.styles['Normal'],
             fontName=self.font_name,
@@ -154,7 +310,7 @@ class HymnPDFGenerator(Configuration):
             spaceAfter=0.2 * inch
         )
 
-        self.symbols_style = ParagraphStyle(
+        symbols_style = ParagraphStyle(
             'SymbolsStyle',
             parent=self.styles['Normal'],
             fontName='DejaVuSans',
@@ -165,7 +321,7 @@ class HymnPDFGenerator(Configuration):
             spaceAfter=0.2 * inch
         )
 
-        self.received_at_style = ParagraphStyle(
+        received_at_style = ParagraphStyle(
             'ReceivedAtStyle',
             parent=self.styles['Normal'],
             fontName=self.font_name,
@@ -175,12 +331,37 @@ class HymnPDFGenerator(Configuration):
             spaceBefore=20
         )
 
+        return {
+            'cover_intro_style': cover_intro_style,
+            'cover_name_style': cover_name_style,
+            'cover_owner_style': cover_owner_style,
+            'title_style': title_style,
+            'title_break_style': title_break_style,
+            'details_on_top_style': details_on_top_style,
+            'body_style': body_style,
+            'davi_star_style': davi_star_style,
+            'symbols_style': symbols_style,
+            'received_at_style': received_at_style,
+        }
+
     def create_pdf(self):
         """
         Create a PDF with the hymn content.
         """
+        # A 1 MiB buffer keeps the write syscall count low when
+        # reportlab flushes the finished document
+        output = open(self.filename, 'wb', buffering=1 << 20)
+        try:
+            self._create_pdf(output)
+        finally:
+            output.close()
+
+    def _create_pdf(self, output):
+        """
+        Build the document into the given writable file object.
+        """
         doc = SimpleDocTemplate(
-            self.filename,
+            output,
             pagesize=self.pagesize,
             leftMargin=self.margin,
             rightMargin=self.margin,
@@ -200,14 +381,42 @@ class HymnPDFGenerator(Configuration):
                                 onPage=self._background_image)
         doc.addPageTemplates([template])
 
-        elements = self._build_elements()
-        doc.build(elements, canvasmaker=PageNumCanvas)
-
-    def _background_image(self, canvas, doc):
+        signature = hash(tuple(
+            (hymn.number, hymn.title, hymn.text, hymn.repetitions)
+            for hymn in self.hymns
+        ))
+        if self._last_signature != signature:
+            # doc.build needs a real list, so the stream of flowables
+            # is materialized only here
+            self._last_elements = list(self._iter_elements())
+            self._last_signature = signature
+
+        # Shape checking validates attribute assignments on every
+        # graphics object; skip it for the build, it only aids debugging
+        previous_shape_checking = rl_config.shapeChecking
+        rl_config.shapeChecking = 0
+        try:
+            # doc.build consumes the list it is given, so hand it a copy
+            doc.build(list(self._last_elements), canvasmaker=PageNumCanvas)
+        finally:
+            rl_config.shapeChecking = previous_shape_checking
+
+    def _prepare_background_image(self):
         """
-        Add background image to the canvas.
+        Load the cover image once and compute its fitted position.
+
+        :return: A tuple of (ImageReader, (x, y, width, height)).
         """
-        img = ImageReader(self.cover_image_path)
+        # Blend the image with white once, instead of painting a
+        # semi-transparent white rectangle over it on every page
+        original = Image.open(self.cover_image_path).convert('RGB')
+        white = Image.new('RGB', original.size, (255, 255, 255))
+        blended = BytesIO()
+        # Re-encode as JPEG so the embedded image stays compressed
+        Image.blend(original, white, 0.5).save(blended, format='JPEG',
+                                               quality=85)
+        blended.seek(0)
+        img = ImageReader(blended)
         img_width, img_height = img.getSize()
 
         # Calculates aspect ratio of image and document
@@ -226,7 +435,15 @@ class HymnPDFGenerator(Configuration):
         x = (page_width - width) / 2
         y = (page_height - height) / 2
 
-        canvas.drawImage(self.cover_image_path,
+        return img, (x, y, width, height)
+
+    def _background_image(self, canvas, doc):
+        """
+        Add background image to the canvas.
+        """
+        x, y, width, height = self._bg_position
+
+        canvas.drawImage(self._bg_image,
                          x,
                          y,
                          width=width,
@@ -234,65 +451,60 @@ class HymnPDFGenerator(Configuration):
                          preserveAspectRatio=True,
                          mask='auto')
 
-        # Adds a semi-transparent rectangle over the image
-        canvas.setFillColorRGB(1, 1, 1, alpha=0.5)  # Semi-transparent white (50% opacity)
-        canvas.rect(0, 0, page_width, page_height, fill=1)
-
-    def _build_vertical_lines(self, hymn: Hymn) -> List[VerticalLine]:
+    def _build_vertical_lines(self, hymn: Hymn) -> List[Flowable]:
         """
-        Create vertical line elements based on hymn bars repetitions.
+        Create the vertical line element based on hymn bars repetitions.
 
         :param hymn: The hymn instance.
-        :return: A list of VerticalLine elements.
+        :return: A list with one VerticalLines element, or empty.
         """
-        elements = []
-        allocator = RepetitionBarXAxisAllocator()
-        bar_positions = allocator.get_entries_with_levels(hymn.repetitions)
+        if not hymn.repetitions:
+            # Nothing to draw, and the allocator cannot parse None
+            return []
 
-        resize_factor = hymn.adjusted_font_size / self.default_body_font_size
-        def resize(number: float) -> float:
-            """Adjust in casa the font was resized to fit in page"""
-            return number * resize_factor
+        segments = []
+        bar_positions = _repetition_bar_entries(hymn.repetitions)
 
-        # Y padding
-        y_padding = -8 + resize(-4)
-        # X distance between bars
-        x_bars_distance = resize(6)
-        # Bar hight for one line
-        one_line = resize(7)
-        # Bar hight for one blank line
-        one_blank_line = resize(8.5)
-        # Distance between two lines
-        between_lines = resize(9)
+        geometry = _bar_geometry(hymn.adjusted_font_size,
+                                 self.default_body_font_size)
+        y_padding = geometry.y_padding
+        x_bars_distance = geometry.x_bars_distance
+        one_line = geometry.one_line
+        one_blank_line = geometry.one_blank_line
+        line_step = geometry.line_step
+
+        # Hoist the per-bar lookups out of the loop
+        count_blank_lines = hymn.count_blank_lines
+        append = segments.append
 
         for bar in bar_positions:
             start = bar['start'] - 1  # Start from 0
             end = bar['end'] - 1  # Start from 0
             level = bar['level']
 
-            blanks_before = hymn.count_blank_lines(0, start)
-            blanks_up_to_end = hymn.count_blank_lines(0, end)
+            blanks_before = count_blank_lines(0, start)
+            blanks_up_to_end = count_blank_lines(0, end)
 
             # Calculate the bar vertical start and end positions
             y_start = (
                 y_padding
-                - (start * one_line
-                   + start * between_lines)
-                - (blanks_before * one_blank_line)
+                - start * line_step
+                - blanks_before * one_blank_line
             )
 
             y_end = (
                 y_padding
-                - ((end + 1) * one_line
-                   + end * between_lines)
-                - (blanks_up_to_end * one_blank_line)
+                - end * line_step
+                - one_line
+                - blanks_up_to_end * one_blank_line
             )
             x_position = -(level * x_bars_distance)
 
-            elements.append(
-                VerticalLine(x_position, y_start, y_end))
+            append((x_position, y_start, y_end))
 
-        return elements
+        if not segments:
+            return []
+        return [VerticalLines(segments)]
 
     def _build_cover_page(self) -> List[Paragraph]:
         """
@@ -301,14 +513,14 @@ class HymnPDFGenerator(Configuration):
         :return: A list of Paragraph objects for the cover page.
         """
         def br_replacement(text: str) -> Paragraph:
-            return Paragraph(text.replace("\n", "<br/>"),
+            return Paragraph(_to_break_tags(text),
                              self.cover_intro_style)
         elements = [
             Spacer(1, 70),
             br_replacement(self.intro_name),
             br_replacement(self.name),
             br_replacement(self.owner),
-            PageBreak(),
+            _PAGE_BREAK,
         ]
 
         return elements
@@ -322,9 +534,10 @@ class HymnPDFGenerator(Configuration):
         :return: A list of elements for the title and header.
         """
         elements = []
-        title = f"{idx:02d}. {hymn.title} ({hymn.number:02d})"
-        elements.append(Paragraph(title, self.title_style))
-        elements.append(HRFlowable(width="100%", thickness=1, color="black", spaceAfter=2))
+        title = self._titles[idx - 1]
+        style = self.title_style if idx == 1 else self.title_break_style
+        elements.append(Paragraph(title, style))
+        elements.append(_TITLE_RULE)
         return elements
 
     def _build_details_on_top(self, hymn: Hymn) -> List[Paragraph]:
@@ -343,23 +556,28 @@ class HymnPDFGenerator(Configuration):
         if hymn.style:
             offered_style.append(hymn.style)
 
-        style = self.details_on_top_style
-        resize_factor = hymn.adjusted_font_size / self.default_body_font_size
-        adjusted_style = ParagraphStyle(
-            name=style.name,
-            parent=style,
-            fontName=self.font_name,
-            spaceAfter=style.spaceAfter * resize_factor,
-        )
-        if offered_style:
-            return [
-                Paragraph(' - '.join(offered_style), adjusted_style)
-            ]
-        else:
+        resize_factor = _bar_geometry(hymn.adjusted_font_size,
+                                      self.default_body_font_size).resize_factor
+        if not offered_style:
+            # Nothing to show; skip the style work entirely
             return [
                 Spacer(1, 12 * resize_factor + 8)
             ]
 
+        style = self.details_on_top_style
+        adjusted_style = self._details_style_cache.get(resize_factor)
+        if adjusted_style is None:
+            adjusted_style = ParagraphStyle(
+                name=style.name,
+                parent=style,
+                fontName=self.font_name,
+                spaceAfter=style.spaceAfter * resize_factor,
+            )
+            self._details_style_cache[resize_factor] = adjusted_style
+        return [
+            Paragraph(' - '.join(offered_style), adjusted_style)
+        ]
+
     def _build_body_paragraphs(self, hymn: Hymn) -> List[Paragraph]:
         """
         Build the body paragraphs for a hymn with adjusted font size.
@@ -368,19 +586,22 @@ class HymnPDFGenerator(Configuration):
         :return: A list of elements for the body paragraphs.
         """
         elements = []
-        paragraphs = hymn.text.strip().split("\n\n")
+        paragraphs = hymn.paragraphs
         font_size = hymn.adjusted_font_size
 
-        adjusted_style = ParagraphStyle(
-            name=self.body_style.name,
-            parent=self.body_style,
-            fontName=self.font_name,
-            fontSize=font_size,
-            leading=font_size + 2
-        )
+        adjusted_style = self._body_style_cache.get(font_size)
+        if adjusted_style is None:
+            adjusted_style = ParagraphStyle(
+                name=self.body_style.name,
+                parent=self.body_style,
+                fontName=self.font_name,
+                fontSize=font_size,
+                leading=font_size + 2
+            )
+            self._body_style_cache[font_size] = adjusted_style
 
-        for paragraph in paragraphs:
-            elements.append(Paragraph(paragraph.replace("\n", "<br/>"), adjusted_style))
+        elements.extend(Paragraph(_to_break_tags(paragraph), adjusted_style)
+                        for paragraph in paragraphs)
         return elements
 
     def _build_davi_star(self) -> Paragraph:
@@ -389,7 +610,7 @@ class HymnPDFGenerator(Configuration):
 
         :return: A Paragraph element containing the Davi star symbol.
         """
-        return Paragraph("&#x2721;", self.davi_star_style)
+        return self._davi_star_paragraph
 
     def _build_additional_symbols(self) -> Paragraph:
         """
@@ -397,11 +618,7 @@ class HymnPDFGenerator(Configuration):
 
         :return: A Paragraph element containing the sun, moon, and star symbols.
         """
-        sun_symbol = "☀"
-        moon_symbol = "☾"
-        star_symbol = "★"
-        symbols = f"{sun_symbol} {moon_symbol} {star_symbol}"
-        return Paragraph(symbols, self.symbols_style)
+        return self._symbols_paragraph
 
     def _build_after_hymn_symbol(self, idx: int) -> Paragraph:
         """
@@ -457,28 +674,70 @@ class HymnPDFGenerator(Configuration):
         return elements
 
 
-    def _build_elements(self) -> List[Paragraph]:
+    def _build_hymn_elements(self, idx: int, hymn: Hymn) -> List[Paragraph]:
         """
-        Build the PDF elements from the hymn content.
+        Build every element belonging to a single hymn.
 
-        :return: A list of Paragraph objects for the PDF.
+        :param idx: The index of the hymn.
+        :param hymn: The hymn instance.
+        :return: A list of elements for the hymn.
         """
         elements = []
+        elements.extend(self._build_title_and_header(idx, hymn))
+        elements.extend(self._build_details_on_top(hymn))
+        elements.extend(self._build_vertical_lines(hymn))
+
+        body_paragraphs = self._build_body_paragraphs(hymn)
+        last_elements = [
+            self._build_after_hymn_symbol(idx),
+            *self._build_received_at(hymn)
+        ]
+        elements.extend(self._keep_together_elements(body_paragraphs, last_elements))
 
-        elements.extend(self._build_cover_page())
-
-        for idx, hymn in enumerate(self.hymns, start=1):
-            elements.extend(self._build_title_and_header(idx, hymn))
-            elements.extend(self._build_details_on_top(hymn))
-            elements.extend(self._build_vertical_lines(hymn))
-
-            body_paragraphs = self._build_body_paragraphs(hymn)
-            last_elements = [
-                self._build_after_hymn_symbol(idx),
-                *self._build_received_at(hymn)
-            ]
-            elements.extend(self._keep_together_elements(body_paragraphs, last_elements))
+        return elements
 
-            elements.append(PageBreak())
+    def __getstate__(self):
+        """
+        Pickle support for the worker processes: the blended cover image
+        wraps a BytesIO and cannot be pickled, and the workers never
+        draw it.
+        """
+        state = {name: getattr(self, name)
+                 for name in Configuration.__slots__}
+        state.update(self.__dict__)
+        state['_bg_image'] = None
+        state['_bg_position'] = None
+        state['_last_signature'] = None
+        state['_last_elements'] = None
+        # The workers reattach the shared module-level base styles
+        # instead of carrying a pickled copy around.
+        del state['styles']
+        return state
+
+    def __setstate__(self, state):
+        for key, value in state.items():
+            setattr(self, key, value)
+        self.styles = _BASE_STYLES
+
+    def _iter_elements(self):
+        """
+        Yield the PDF flowables for the whole document, hymn by hymn.
 
-        return elements
+        Streaming the elements lets each hymn's intermediate lists be
+        dropped as soon as its flowables are handed over, instead of
+        coexisting with the growing story.
+        """
+        yield from self._build_cover_page()
+
+        # Each hymn's elements are independent of the others, so large
+        # books are laid out across worker processes.
+        if len(self.hymns) >= MIN_HYMNS_FOR_PARALLEL_BUILD:
+            with ProcessPoolExecutor() as executor:
+                for hymn_elements in executor.map(
+                        self._build_hymn_elements,
+                        range(1, len(self.hymns) + 1),
+                        self.hymns):
+                    yield from hymn_elements
+        else:
+            for idx, hymn in enumerate(self.hymns, start=1):
+                yield from self._build_hymn_elements(idx, hymn)
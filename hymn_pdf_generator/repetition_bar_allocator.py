@@ -1,3 +1,5 @@
+from bisect import bisect_left, bisect_right
+from operator import itemgetter
 from typing import List, Dict, Tuple
 
 class RepetitionBarXAxisAllocator:
@@ -17,7 +19,30 @@ class RepetitionBarXAxisAllocator:
     """
 
     def __init__(self):
-        self.allocation: Dict[int, int] = {}
+        # Disjoint (start, end, level) intervals sorted by start, where
+        # the level is the one of the latest entry covering each line.
+        # Keeping intervals instead of one dict entry per line keeps
+        # the work proportional to the number of bars, not to how many
+        # lines they span.
+        self._intervals: List[Tuple[int, int, int]] = []
+
+    def _overlap_slice(self, start: int, end: int) -> Tuple[int, int]:
+        """
+        Locate the intervals overlapping [start, end].
+
+        Since the intervals are disjoint and sorted, the overlapping
+        ones form a contiguous slice, found with two bisections.
+
+        Args:
+            start (int): The starting number of the range.
+            end (int): The ending number of the range.
+
+        Returns:
+            Tuple[int, int]: The (lo, hi) bounds of the slice.
+        """
+        lo = bisect_left(self._intervals, start, key=itemgetter(1))
+        hi = bisect_right(self._intervals, end, key=itemgetter(0))
+        return lo, hi
 
     def get_level(self, ranges: List[Tuple[int, int]]) -> int:
         """
@@ -31,13 +56,12 @@ class RepetitionBarXAxisAllocator:
         """
         max_level = 0
         # Iterate over each range in the list of ranges
-        for r in ranges:
-            # Iterate over each number in the current range
-            for i in range(r[0], r[1] + 1):
-                # Check if the current number is already allocated
-                if i in self.allocation:
-                    # Update the maximum level found so far
-                    max_level = max(max_level, self.allocation[i])
+        for start, end in ranges:
+            lo, hi = self._overlap_slice(start, end)
+            # Check the levels already allocated on overlapping lines
+            for _, _, level in self._intervals[lo:hi]:
+                if level > max_level:
+                    max_level = level
         # The next available level is one more than the maximum level found
         return max_level + 1
 
@@ -52,12 +76,39 @@ class RepetitionBarXAxisAllocator:
         Returns:
             int: The allocated level for this range.
         """
-        level = self.get_level([(start, end)])
-        # Update the allocation dictionary for each number in the current range
-        for i in range(start, end + 1):
-            self.allocation[i] = level
+        lo, hi = self._overlap_slice(start, end)
+        overlapped = self._intervals[lo:hi]
+        level = 1 + max((iv[2] for iv in overlapped), default=0)
+
+        # Overwrite the covered region with the new level, keeping the
+        # uncovered tails of partially overlapped neighbours
+        replacement = []
+        if overlapped and overlapped[0][0] < start:
+            first = overlapped[0]
+            replacement.append((first[0], start - 1, first[2]))
+        replacement.append((start, end, level))
+        if overlapped and overlapped[-1][1] > end:
+            last = overlapped[-1]
+            replacement.append((end + 1, last[1], last[2]))
+        self._intervals[lo:hi] = replacement
+
         return level
 
+    @staticmethod
+    def _parse_entries(s: str) -> List[Tuple[int, int]]:
+        """
+        Parses the input string into (start, end) pairs.
+
+        Args:
+            s (str): A string containing entries in the format "start-end" separated by commas.
+
+        Returns:
+            List[Tuple[int, int]]: The parsed ranges, in order.
+        """
+        if not s:
+            return []
+        return [tuple(map(int, entry.split('-'))) for entry in s.split(',')]
+
     def allocate_levels(self, s: str) -> List[int]:
         """
         Allocates levels to each entry in the input string.
@@ -68,19 +119,8 @@ class RepetitionBarXAxisAllocator:
         Returns:
             List[int]: A list of integers representing the level of each entry.
         """
-        entries = s.split(',')
-        levels = []
-
-        # Iterate over each entry in the list of entries
-        for entry in entries:
-            # Parse the start and end of the current range
-            start, end = map(int, entry.split('-'))
-            # Allocate the appropriate level for the current range
-            level = self._allocate_level_for_entry(start, end)
-            # Append the determined level to the levels list
-            levels.append(level)
-
-        return levels
+        return [self._allocate_level_for_entry(start, end)
+                for start, end in self._parse_entries(s)]
 
     def get_entries_with_levels(self, s: str) -> List[Dict[str, int]]:
         """
@@ -92,20 +132,8 @@ class RepetitionBarXAxisAllocator:
         Returns:
             List[Dict[str, int]]: A list of dictionaries, each containing 'start', 'end', and 'level'.
         """
-        entries = s.split(',')
-        result = []
-
-        # Iterate over each entry in the list of entries
-        for entry in entries:
-            # Parse the start and end of the current range
-            start, end = map(int, entry.split('-'))
-            # Allocate the appropriate level for the current range
-            level = self._allocate_level_for_entry(start, end)
-            # Append a dictionary with start, end, and level to the result list
-            result.append({
-                'start': start,
-                'end': end,
-                'level': level,
-            })
-
-        return result
+        return [{
+            'start': start,
+            'end': end,
+            'level': self._allocate_level_for_entry(start, end),
+        } for start, end in self._parse_entries(s)]
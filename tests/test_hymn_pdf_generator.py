@@ -3,3 +3,43 @@ from hymn_pdf_generator import __version__
 
 def test_version():
     assert __version__ == '0.1.0'
+
+
+def test_page_number_drawn_once_per_non_cover_page(tmp_path, monkeypatch):
+    from PIL import Image
+
+    from hymn_pdf_generator.models import Hymn
+    from hymn_pdf_generator.pdf_elements import HymnPDFGenerator, \
+        PageNumCanvas
+
+    cover_path = tmp_path / 'cover.jpg'
+    Image.new('RGB', (40, 60), (120, 80, 40)).save(cover_path)
+
+    hymns = [
+        Hymn(number=idx, title=f'Hymn {idx}', style=None, offered_to=None,
+             extra_instructions=None, text='First line\nSecond line',
+             repetitions='1-2', received_at=None)
+        for idx in (1, 2)
+    ]
+    filename = str(tmp_path / 'book.pdf')
+    generator = HymnPDFGenerator(hymns, filename, 'Intro', 'Name',
+                                 'Owner', str(cover_path))
+
+    drawn_numbers = []
+    original = PageNumCanvas.draw_page_number
+
+    def recording_draw(self):
+        if self.getPageNumber() > 1:
+            drawn_numbers.append(self.getPageNumber() - 1)
+        original(self)
+
+    monkeypatch.setattr(PageNumCanvas, 'draw_page_number', recording_draw)
+    generator.create_pdf()
+
+    data = (tmp_path / 'book.pdf').read_bytes()
+    pages = data.count(b'/Type /Page') - data.count(b'/Type /Pages')
+
+    # Cover plus one page per hymn, each numbered exactly once, and no
+    # spurious trailing page carrying only a page number
+    assert pages == 1 + len(hymns)
+    assert drawn_numbers == list(range(1, pages))
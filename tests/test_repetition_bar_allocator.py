@@ -0,0 +1,15 @@
+from hymn_pdf_generator.repetition_bar_allocator import (
+    RepetitionBarXAxisAllocator,
+)
+
+
+def test_allocate_levels_docstring_example():
+    allocator = RepetitionBarXAxisAllocator()
+    assert allocator.allocate_levels("1-2,3-4,1-4,2-3,3-5") == [1, 1, 2, 3, 4]
+
+
+def test_later_entries_shadow_earlier_levels():
+    allocator = RepetitionBarXAxisAllocator()
+    # The second entry overwrites lines 1-4 with level 2, so a bar on
+    # those lines stacks on the latest level, not the first one.
+    assert allocator.allocate_levels("1-4,1-4,2-3") == [1, 2, 3]